@@ -6,47 +6,363 @@ It converts the content into well-formatted markdown files while preserving the
 
 Features:
 - Handles nested topic structures
+- Fetches all topics and their articles concurrently with asyncio
+- Parses articles in a process pool so parsing overlaps with downloads
 - Preserves code blocks with language detection
-- Implements polite scraping with random delays
+- Implements polite scraping with bounded concurrency and rate limiting
 - Robust error handling and content extraction
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
+import asyncio
+import codecs
+import httpx
+from lxml import etree, html as lxml_html
+import multiprocessing
 import os
-import random
+import re
+import shelve
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import time
 from urllib.parse import urljoin
 
+# Tags of the content elements of an article. Divs only count when "code" is
+# one of their classes.
+ARTICLE_TAGS = ('p', 'h2', 'h3', 'h4', 'pre', 'code', 'ul', 'ol', 'div')
+
+# Markdown prefixes for article headers, one level below the article title
+HEADER_PREFIXES = {'h2': '### ', 'h3': '#### ', 'h4': '##### '}
+
+# Matches "code" as a whole token of a raw class attribute string
+CODE_CLASS_RE = re.compile(r'(?:^|\s)code(?:\s|$)')
+
+# Captures the language from a "language-*" class, e.g. "language-python"
+LANG_RE = re.compile(r'language-(\S+)')
+
+# Candidate article containers: the first <article> and the first div carrying
+# one of the known content classes.
+CONTAINER_XPATH = etree.XPath(
+    "(//article)[1]"
+    " | (//div[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' entry-content ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' article-content ')])[1]"
+)
+
+def parse_html(html, encoding=None):
+    """
+    Parse an HTML document into an lxml tree.
+    
+    Encoding names are normalized to Python's canonical codec names first. When
+    libxml2 does not know the codec, the bytes are decoded in Python instead.
+    Codecs that are not text encodings are ignored and the encoding is sniffed
+    from the document.
+    
+    Args:
+        html (str or bytes): The HTML document
+        encoding (str): Encoding of html when it is given as bytes
+        
+    Returns:
+        lxml.html.HtmlElement or None: Root element, or None if the document could not be parsed
+    """
+    try:
+        if isinstance(html, bytes) and encoding:
+            try:
+                name = codecs.lookup(encoding).name
+            except LookupError:
+                name = None
+            if name:
+                try:
+                    return lxml_html.fromstring(html, parser=lxml_html.HTMLParser(encoding=name))
+                except LookupError:
+                    try:
+                        html = html.decode(name, errors='replace')
+                    except LookupError:
+                        # Not a text encoding (e.g. "hex"); let libxml2 sniff the bytes below
+                        pass
+        
+        try:
+            return lxml_html.fromstring(html)
+        except ValueError:
+            # lxml rejects text carrying an XML encoding declaration, so hand it over as UTF-8 bytes
+            if not isinstance(html, str):
+                raise
+            return lxml_html.fromstring(html.encode('utf-8'), parser=lxml_html.HTMLParser(encoding='utf-8'))
+    except (etree.ParserError, ValueError):
+        return None
+
+def extract_article_content(html, encoding=None):
+    """
+    Extract and format article content, preserving structure and code blocks.
+    
+    Handles various content elements including:
+    - Headers of different levels
+    - Paragraphs and text content
+    - Code blocks with language detection
+    - Ordered and unordered lists
+    
+    Runs in worker processes, so it is kept at module level to stay picklable.
+    
+    Args:
+        html (str or bytes): The HTML content of the article
+        encoding (str): Encoding of html when it is given as bytes
+        
+    Returns:
+        dict or None: Dictionary with 'title' and 'content' keys, or None if extraction failed
+    """
+    if not html:
+        return None
+    
+    tree = parse_html(html, encoding)
+    if tree is None:
+        return None
+    
+    # Get article title
+    title = ""
+    h1 = tree.find('.//h1')
+    if h1 is not None:
+        title = h1.text_content().strip()
+    
+    markdown_content = []
+    
+    # Find main article container
+    containers = CONTAINER_XPATH(tree)
+    main_content = next((c for c in containers if c.tag == 'article'), containers[0] if containers else None)
+    
+    if main_content is not None:
+        # Track code block state
+        in_code_block = False
+        current_code_block = []
+        current_language = None
+        
+        # Process content elements in a single walk over the article
+        for element in main_content.iterdescendants(*ARTICLE_TAGS):
+            if element.tag == 'div':
+                class_str = element.get('class') or ''
+                if 'code' not in class_str or not CODE_CLASS_RE.search(class_str):
+                    continue
+            
+            # Process headers
+            if element.tag in HEADER_PREFIXES:
+                # Close any open code block before adding header
+                if in_code_block and current_code_block:
+                    markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
+                    current_code_block = []
+                    in_code_block = False
+                
+                markdown_content.append('\n' + HEADER_PREFIXES[element.tag] + element.text_content().strip() + '\n')
+            
+            # Process paragraphs
+            elif element.tag == 'p':
+                if in_code_block and current_code_block:
+                    markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
+                    current_code_block = []
+                    in_code_block = False
+                
+                text = element.text_content().strip()
+                if text:
+                    markdown_content.append(f"\n{text}\n")
+            
+            # Process code blocks (pre, code and div.code)
+            elif element.tag in ['pre', 'code', 'div']:
+                code_text = element.text_content()
+                
+                # Handle code block state; the language comes from the block's first element
+                if not in_code_block:
+                    in_code_block = True
+                    m = LANG_RE.search(element.get('class') or '')
+                    current_language = m.group(1) if m else None
+                
+                if code_text and not code_text.isspace():
+                    current_code_block.append(code_text)
+            
+            # Process lists
+            elif element.tag in ['ul', 'ol']:
+                if in_code_block and current_code_block:
+                    markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
+                    current_code_block = []
+                    in_code_block = False
+                
+                markdown_content.append("\n")
+                for li in element.iter('li'):
+                    markdown_content.append(f"- {li.text_content().strip()}\n")
+        
+        # Close any remaining code block
+        if in_code_block and current_code_block:
+            markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
+    
+    return {
+        'title': title,
+        'content': ''.join(markdown_content)
+    }
+
+def has_at_least(node, tag, n):
+    """
+    Check whether an element has at least n descendants with the given tag.
+    
+    Stops walking the subtree as soon as n matches have been seen.
+    
+    Args:
+        node (lxml.html.HtmlElement): The element to search
+        tag (str): The descendant tag to count
+        n (int): The number of matches required
+        
+    Returns:
+        bool: True if at least n matching descendants exist
+    """
+    return sum(1 for _ in zip(range(n), node.iterdescendants(tag))) == n
+
+class RateLimiter:
+    """
+    Token bucket limiting how many requests may be started per second.
+    
+    Attributes:
+        rate (float): Tokens added to the bucket per second
+        capacity (float): Maximum number of tokens the bucket can hold
+    """
+    
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate (float): Number of requests allowed per second on average
+            capacity (float): Burst size, defaults to one second worth of requests but at least one
+            
+        Raises:
+            ValueError: If rate is not positive or capacity is below one token
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        if self.capacity < 1:
+            raise ValueError("capacity must hold at least one token")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 class GeeksForGeeksScraper:
     """
     A web scraper class specifically designed for GeeksForGeeks algorithm tutorials.
     
     Attributes:
-        session (requests.Session): Maintains cookies and connection pooling
-        delay_range (tuple): Min and max seconds to wait between requests
+        client (httpx.AsyncClient): Maintains cookies and connection pooling
+        semaphore (asyncio.Semaphore): Caps the number of requests in flight
+        rate_limiter (RateLimiter): Spaces out the start of consecutive requests
+        executor (ProcessPoolExecutor): Worker processes that parse fetched articles
+        cache (shelve.Shelf or None): Previously fetched pages with their validators, keyed by URL
         base_url (str): The base URL for GeeksForGeeks
     """
     
-    def __init__(self, delay_range=(1, 3)):
+    def __init__(self, max_concurrency=10, requests_per_second=0.5, cache_dir='.page_cache'):
         """
-        Initialize the scraper with custom headers and delay settings.
+        Initialize the scraper with custom headers and politeness settings.
         
         Args:
-            delay_range (tuple): Range of seconds (min, max) to delay between requests
+            max_concurrency (int): Maximum number of requests in flight at once
+            requests_per_second (float): Average number of requests started per second;
+                the default matches the 1-3 second delay the scraper used to sleep per request
+            cache_dir (str or None): Directory for the on-disk page cache, or None to disable it
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        self.delay_range = delay_range
+        self.client = httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            },
+            follow_redirects=True,
+            # The rate limiter leaves pooled connections idle for seconds between uses;
+            # keep them well past httpx's 5 s default so they are reused, not re-handshaked
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_limiter = RateLimiter(requests_per_second)
+        # Workers are started after the event loop has spun up threads, so avoid fork()
+        self.executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+        self.cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.cache = shelve.open(os.path.join(cache_dir, 'pages'))
         self.base_url = "https://www.geeksforgeeks.org"
 
-    def _delay(self):
-        """Implement a random delay between requests to avoid overwhelming the server."""
-        time.sleep(random.uniform(*self.delay_range))
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP client, shut down the parsing workers and flush the cache."""
+        await self.client.aclose()
+        # shutdown() blocks until the workers exit, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        if self.cache is not None:
+            self.cache.close()
+
+    async def _get(self, url):
+        """
+        Fetch a URL, revalidating any cached copy with a conditional GET.
+        
+        A 304 response is answered from the cache, so unchanged pages are not
+        downloaded again on repeated runs.
+        
+        Args:
+            url (str): The URL to fetch
+            
+        Returns:
+            tuple: The response body as bytes and its character encoding
+            
+        Raises:
+            httpx.HTTPError: If the request failed
+        """
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        async with self.semaphore:
+            await self.rate_limiter.acquire()
+            response = await self.client.get(url, headers=headers, timeout=10)
+        
+        if cached and response.status_code == 304:
+            return cached['content'], cached['encoding']
+        
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        # Only write changed entries; the dbm.dumb backend appends every rewrite to its data file
+        unchanged = (
+            cached
+            and cached['etag'] == etag
+            and cached['last_modified'] == last_modified
+            and cached['content'] == response.content
+        )
+        if self.cache is not None and (etag or last_modified) and not unchanged:
+            self.cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content': response.content,
+                'encoding': response.encoding,
+            }
+        return response.content, response.encoding
 
-    def fetch_page(self, url):
+    async def fetch_page(self, url):
         """
         Fetch a webpage with error handling and timeout.
         
@@ -54,18 +370,39 @@ class GeeksForGeeksScraper:
             url (str): The URL to fetch
             
         Returns:
-            str or None: The page HTML content, or None if the request failed
+            tuple or None: The page body as bytes and its encoding, or None if the request failed
         """
         try:
-            self._delay()
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
+            return await self._get(url)
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             print(f"Error fetching {url}: {str(e)}")
             return None
 
-    def find_topic_section(self, soup):
+    async def fetch_article(self, url):
+        """
+        Fetch an article and extract its content in a worker process.
+        
+        Parsing is CPU-bound, so it is handed to the process pool while the
+        event loop keeps downloading other articles.
+        
+        Args:
+            url (str): The article URL to fetch
+            
+        Returns:
+            dict or None: Extracted article content, or None if the request failed
+        """
+        page = await self.fetch_page(url)
+        if page is None:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, extract_article_content, *page)
+        except (LookupError, ValueError, BrokenProcessPool) as e:
+            print(f"Error parsing {url}: {str(e)}")
+            return None
+
+    def find_topic_section(self, tree):
         """
         Locate the main content section containing organized topic links.
         
@@ -73,10 +410,10 @@ class GeeksForGeeksScraper:
         content container based on common GeeksForGeeks page structures.
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (lxml.html.HtmlElement): Root element of the parsed page
             
         Returns:
-            bs4.element.Tag or None: The main content section if found
+            lxml.html.HtmlElement or None: The main content section if found
         """
         patterns = [
             # Headers followed by lists pattern
@@ -87,37 +424,76 @@ class GeeksForGeeksScraper:
             {'container': ['post-content', 'entry-content', 'article-content']}
         ]
         
+        # Headers and lists in document order, shared by the first two patterns
+        nodes = list(tree.iter('h2', 'h3', 'ul'))
+        
+        # Patterns are tried in priority order on every page
         for pattern in patterns:
-            if 'headers' in pattern:
-                # Try finding sections with headers that have substantial link lists
-                for header_tag in pattern['headers']:
-                    headers = soup.find_all(header_tag)
-                    for header in headers:
-                        next_ul = header.find_next('ul')
-                        if next_ul and len(next_ul.find_all('a')) >= pattern['min_links']:
-                            return header.parent
+            section = self._match_pattern(tree, nodes, pattern)
+            if section is not None:
+                return section
+        
+        return None
+
+    def _match_pattern(self, tree, nodes, pattern):
+        """
+        Apply a single find_topic_section pattern to a page.
+        
+        Args:
+            tree (lxml.html.HtmlElement): Root element of the parsed page
+            nodes (list): The page's h2, h3 and ul elements in document order
+            pattern (dict): One of the patterns from find_topic_section
             
-            elif 'lists' in pattern:
-                # Look for significant list clusters
-                lists = soup.find_all('ul')
-                for ul in lists:
-                    if len(ul.find_all('a')) >= pattern['min_links']:
-                        return ul.parent
+        Returns:
+            lxml.html.HtmlElement or None: The matching section if found
+        """
+        if 'headers' in pattern:
+            # Try finding sections with headers that have substantial link lists.
+            # Headers seen since the last list all share the next list as their
+            # find_next('ul'), so a single walk finds the first qualifying header
+            # of each level; earlier levels in pattern['headers'] take priority.
+            matches = {}
+            pending = []
+            for node in nodes:
+                if node.tag != 'ul':
+                    if node.tag in pattern['headers'] and node.tag not in matches:
+                        pending.append(node)
+                    continue
+                if pending and has_at_least(node, 'a', pattern['min_links']):
+                    for header in pending:
+                        matches.setdefault(header.tag, header)
+                    if pattern['headers'][0] in matches:
+                        break
+                pending = []
             
-            elif 'container' in pattern:
-                # Check known content container classes
-                for class_name in pattern['container']:
-                    container = soup.find('div', class_=class_name)
-                    if container and container.find_all('a'):
-                        return container
+            for header_tag in pattern['headers']:
+                if header_tag in matches:
+                    return matches[header_tag].getparent()
+        
+        elif 'lists' in pattern:
+            # Look for significant list clusters
+            for ul in nodes:
+                if ul.tag == pattern['lists'] and has_at_least(ul, 'a', pattern['min_links']):
+                    return ul.getparent()
+        
+        elif 'container' in pattern:
+            # Check known content container classes, collected in a single walk
+            containers = [
+                div for div in tree.iter('div')
+                if not set(pattern['container']).isdisjoint((div.get('class') or '').split())
+            ]
+            for class_name in pattern['container']:
+                container = next((c for c in containers if class_name in (c.get('class') or '').split()), None)
+                if container is not None and container.find('.//a') is not None:
+                    return container
         
         return None
 
-    def scrape_from_url(self, url):
+    async def scrape_from_url(self, url):
         """
         Main scraping method that processes a GeeksForGeeks topic page.
         
-        Extracts the topic structure and recursively scrapes linked articles,
+        Extracts the topic structure and concurrently scrapes linked articles,
         organizing everything into a markdown-formatted hierarchy.
         
         Args:
@@ -127,161 +503,83 @@ class GeeksForGeeksScraper:
             list or None: List of markdown content strings, or None if scraping failed
         """
         print(f"Fetching main page: {url}")
-        html_content = self.fetch_page(url)
-        if not html_content:
+        page = await self.fetch_page(url)
+        if not page:
             return None
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse the raw bytes with the response encoding (httpx falls back to UTF-8),
+        # which takes precedence over any <meta charset> in the page
+        tree = parse_html(*page)
+        if tree is None:
+            return None
         
         # Extract page title
-        page_title = soup.find('h1')
-        main_title = page_title.get_text(strip=True) if page_title else "GeeksForGeeks Guide"
+        page_title = tree.find('.//h1')
+        main_title = page_title.text_content().strip() if page_title is not None else "GeeksForGeeks Guide"
         
         # Locate the main content section
-        topic_section = self.find_topic_section(soup)
-        if not topic_section:
+        topic_section = self.find_topic_section(tree)
+        if topic_section is None:
             print("Could not find topic section in the page")
             return None
         
-        # Build markdown content
-        markdown_content = [f"# {main_title}\n"]
+        # Map each header to the first list after it in the document, in one walk
+        next_lists = {}
+        pending = []
+        for node in tree.iter('h2', 'h3', 'ul'):
+            if node.tag == 'ul':
+                for header in pending:
+                    next_lists[header] = node
+                pending = []
+            else:
+                pending.append(node)
         
-        # Process each section and its articles
-        for header in topic_section.find_all(['h2', 'h3']):
-            section_title = header.get_text(strip=True)
+        # Collect the section structure first so articles can be fetched together
+        sections = []
+        article_urls = []
+        for header in topic_section.iterdescendants('h2', 'h3'):
+            section_title = header.text_content().strip()
             if not section_title or len(section_title) < 2:
                 continue
                 
             print(f"\nProcessing section: {section_title}")
-            markdown_content.append(f"\n## {section_title}\n")
+            articles = []
             
-            # Process articles in the section
-            ul = header.find_next('ul')
-            if ul:
-                for li in ul.find_all('li'):
-                    link = li.find('a')
-                    if link and link.get('href'):
+            ul = next_lists.get(header)
+            if ul is not None:
+                for li in ul.iterdescendants('li'):
+                    link = li.find('.//a')
+                    if link is not None and link.get('href'):
                         article_url = urljoin(self.base_url, link.get('href'))
-                        text = link.get_text(strip=True)
+                        text = link.text_content().strip()
                         print(f"Scraping: {text} - {article_url}")
                         
-                        markdown_content.append(f"\n### {text}\n")
-                        
-                        # Get article content
-                        page_html = self.fetch_page(article_url)
-                        if page_html:
-                            article_content = self.extract_article_content(page_html)
-                            if article_content:
-                                markdown_content.append(article_content['content'])
-                        
-                        markdown_content.append("\n---\n")
-        
-        return markdown_content
-    
-    def extract_article_content(self, html):
-        """
-        Extract and format article content, preserving structure and code blocks.
-        
-        Handles various content elements including:
-        - Headers of different levels
-        - Paragraphs and text content
-        - Code blocks with language detection
-        - Ordered and unordered lists
-        
-        Args:
-            html (str): The HTML content of the article
-            
-        Returns:
-            dict or None: Dictionary with 'title' and 'content' keys, or None if extraction failed
-        """
-        if not html:
-            return None
+                        articles.append((text, len(article_urls)))
+                        article_urls.append(article_url)
             
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Get article title
-        title = ""
-        h1 = soup.find('h1')
-        if h1:
-            title = h1.get_text(strip=True)
+            sections.append((section_title, articles))
         
-        markdown_content = []
+        # Fetch every article concurrently; results keep the order of article_urls
+        results = await asyncio.gather(*(self.fetch_article(article_url) for article_url in article_urls))
         
-        # Find main article container
-        main_content = soup.find('article') or soup.find('div', {'class': ['post-content', 'entry-content', 'article-content']})
+        # Build markdown content
+        markdown_content = [f"# {main_title}\n"]
         
-        if main_content:
-            # Track code block state
-            in_code_block = False
-            current_code_block = []
-            current_language = None
-            
-            # Process content elements
-            elements = main_content.find_all(['p', 'h2', 'h3', 'h4', 'pre', 'code', 'ul', 'ol', 'div'])
+        for section_title, articles in sections:
+            markdown_content.append(f"\n## {section_title}\n")
             
-            for element in elements:
-                # Process headers
-                if element.name in ['h2', 'h3', 'h4']:
-                    # Close any open code block before adding header
-                    if in_code_block and current_code_block:
-                        markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
-                        current_code_block = []
-                        in_code_block = False
-                    
-                    level = int(element.name[1]) + 1
-                    markdown_content.append(f"\n{'#' * level} {element.get_text(strip=True)}\n")
+            for text, page_idx in articles:
+                markdown_content.append(f"\n### {text}\n")
                 
-                # Process paragraphs
-                elif element.name == 'p':
-                    if in_code_block and current_code_block:
-                        markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
-                        current_code_block = []
-                        in_code_block = False
-                    
-                    text = element.get_text(strip=True)
-                    if text:
-                        markdown_content.append(f"\n{text}\n")
+                # Get article content
+                article_content = results[page_idx]
+                if article_content:
+                    markdown_content.append(article_content['content'])
                 
-                # Process code blocks
-                elif element.name in ['pre', 'code'] or (element.name == 'div' and 'code' in element.get('class', [])):
-                    code_text = element.get_text()
-                    
-                    # Detect programming language from class
-                    language = None
-                    if 'class' in element.attrs:
-                        classes = element.get('class', [])
-                        language_classes = [c for c in classes if 'language-' in c]
-                        if language_classes:
-                            language = language_classes[0].replace('language-', '')
-                    
-                    # Handle code block state
-                    if not in_code_block:
-                        in_code_block = True
-                        current_language = language
-                    
-                    if code_text.strip():
-                        current_code_block.append(code_text)
-                
-                # Process lists
-                elif element.name in ['ul', 'ol']:
-                    if in_code_block and current_code_block:
-                        markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
-                        current_code_block = []
-                        in_code_block = False
-                    
-                    markdown_content.append("\n")
-                    for li in element.find_all('li'):
-                        markdown_content.append(f"- {li.get_text(strip=True)}\n")
-            
-            # Close any remaining code block
-            if in_code_block and current_code_block:
-                markdown_content.append(f"\n```{current_language or ''}\n{''.join(current_code_block)}\n```\n")
-        
-        return {
-            'title': title,
-            'content': "\n".join(markdown_content)
-        }
-
+                markdown_content.append("\n---\n")
+        
+        return markdown_content
+    
     def save_content(self, content, filename):
         """
         Save the scraped content to a markdown file.
@@ -293,11 +591,12 @@ class GeeksForGeeksScraper:
         os.makedirs('scraped_content', exist_ok=True)
         filepath = os.path.join('scraped_content', filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content))
+        # Fragments carry their own newlines, so they can be streamed out as-is
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(content)
         print(f"\nContent saved to {filepath}")
 
-def main():
+async def main():
     """
     Main execution function that initializes the scraper and processes multiple URLs.
     
@@ -310,9 +609,6 @@ def main():
     - Geometric Algorithms
     - Randomized Algorithms
     """
-    # Initialize scraper
-    scraper = GeeksForGeeksScraper()
-    
     # List of algorithm topic URLs to scrape
     urls = [
         "https://www.geeksforgeeks.org/greedy-algorithms/",
@@ -324,18 +620,29 @@ def main():
         "https://www.geeksforgeeks.org/randomized-algorithms/"
     ]
     
-    for url in urls:
+    async def process(scraper, url):
         # Generate filename from the last part of the URL
         filename = url.split('/')[-2] if url.endswith('/') else url.split('/')[-1]
         filename = f"{filename}.md"
         
         # Scrape and save content
-        content = scraper.scrape_from_url(url)
+        content = await scraper.scrape_from_url(url)
         
         if content:
             scraper.save_content(content, filename)
         else:
-            print("Failed to scrape content from the URL")
+            print(f"Failed to scrape content from {url}")
+    
+    # Initialize a single scraper so every topic shares one connection pool,
+    # semaphore and rate limiter while the topics are scraped concurrently
+    async with GeeksForGeeksScraper() as scraper:
+        await asyncio.gather(*(process(scraper, url) for url in urls))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # uvloop is an optional, faster event loop; it is not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file